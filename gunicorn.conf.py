@@ -0,0 +1,14 @@
+import os
+
+bind = "0.0.0.0:8080"
+
+# Set WEB_CONCURRENCY in production. The fallback counts CPUs this process may
+# run on (cpu_count() reports the host's cores inside containers) and is capped
+# because CPU quotas are not visible here either.
+if hasattr(os, "sched_getaffinity"):
+    _cpus = len(os.sched_getaffinity(0))
+else:
+    _cpus = os.cpu_count() or 1
+workers = int(os.getenv("WEB_CONCURRENCY", min(_cpus * 2 + 1, 9)))
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", 8))